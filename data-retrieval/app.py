@@ -1,7 +1,9 @@
-import json
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from flask import Flask, Response, jsonify, make_response
+import orjson
+from flask import Flask, Response
 from flask_restx import Api, Resource, reqparse
 
 from fixture_set import FixtureSet
@@ -16,6 +18,82 @@ fixture_parser = reqparse.RequestParser()
 fixture_parser.add_argument("month", type=str, required=True)
 fixture_parser.add_argument("year", type=int, required=True)
 
+season_parser = reqparse.RequestParser()
+season_parser.add_argument("year", type=int, required=True)
+
+SEASON_MONTHS = (
+    "october",
+    "november",
+    "december",
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+)
+
+ACCEPTED_MONTHS = frozenset(SEASON_MONTHS)
+
+VALID_YEARS = range(2014, 2024)
+
+FIXTURE_KEY_MAP = {
+    "Date": "date",
+    "Tip-Off Time": "tipOffTime",
+    "Away Team": "awayTeam",
+    "Away PTS": "awayPoints",
+    "Home Team": "homeTeam",
+    "Home PTS": "homePoints",
+    "Attendance": "attendance",
+}
+
+
+@functools.lru_cache(maxsize=128)
+def build_month_fixtures(month: str, year: int) -> dict:
+    """
+    Build the fixtures response object for a month of NBA games.
+
+    Every supported season has already been played, so the scraped data never
+    changes and the object can be cached per (month, year) for the lifetime of
+    the process.
+
+    :param month: The month of the fixtures.
+    :type month: str
+    :param year: The season within which the fixtures are played.
+    :type year: int
+    :return: The fixtures response object.
+    :rtype: dict
+    """
+
+    this_fixture_set = FixtureSet(month, str(year))
+
+    fixtures = [
+        {FIXTURE_KEY_MAP[key]: value for key, value in row.items()}
+        for row in this_fixture_set.get_fixtures()
+    ]
+
+    return {
+        "month": month,
+        "year": year,
+        "fixtureCount": len(fixtures),
+        "fixtures": fixtures,
+    }
+
+
+def build_fixtures_response(month: str, year: int) -> bytes:
+    """
+    Build the serialized fixtures response body for a month of NBA games.
+
+    :param month: The month of the fixtures.
+    :type month: str
+    :param year: The season within which the fixtures are played.
+    :type year: int
+    :return: The serialized response body.
+    :rtype: bytes
+    """
+
+    return orjson.dumps(build_month_fixtures(month, year))
+
 
 @scrape.route("/fixtures")
 class Fixtures(Resource):
@@ -30,56 +108,66 @@ class Fixtures(Resource):
         month = (args["month"]).lower()
         year = args["year"]
 
-        accepted_months = [
-            "october",
-            "november",
-            "december",
-            "january",
-            "february",
-            "march",
-            "april",
-            "may",
-            "june",
-        ]
-
-        if month not in accepted_months:
-            return make_response(jsonify("Invalid month selection."), 400)
-
-        if year < 2014 or year > 2023:
-            return make_response(jsonify("Invalid year selection."), 400)
-
-        this_fixture_set = FixtureSet(month, str(year))
-        this_fixture_dataframe = this_fixture_set.get_dataframe()
-
-        fixtures = []
-
-        row = 0
-        while row < len(this_fixture_dataframe):
-            fixtures.append(
-                {
-                    "date": this_fixture_dataframe["Date"][row],
-                    "tipOffTime": this_fixture_dataframe["Tip-Off Time"][row],
-                    "awayTeam": this_fixture_dataframe["Away Team"][row],
-                    "awayPoints": int(this_fixture_dataframe["Away PTS"][row]),
-                    "homeTeam": this_fixture_dataframe["Home Team"][row],
-                    "homePoints": int(this_fixture_dataframe["Home PTS"][row]),
-                    "attendance": this_fixture_dataframe["Attendance"][row],
-                }
+        if month not in ACCEPTED_MONTHS:
+            return Response(
+                orjson.dumps("Invalid month selection."),
+                mimetype="application/json",
+                status=400,
             )
-            row += 1
 
-        final_object = {
-            "month": month,
-            "year": year,
-            "fixtureCount": len(fixtures),
-            "fixtures": fixtures,
-        }
+        if year not in VALID_YEARS:
+            return Response(
+                orjson.dumps("Invalid year selection."),
+                mimetype="application/json",
+                status=400,
+            )
 
         return Response(
-            json.dumps(final_object), mimetype="application/json", status=200
+            build_fixtures_response(month, year),
+            mimetype="application/json",
+            status=200,
         )
 
 
+@scrape.route("/fixtures/season")
+class SeasonFixtures(Resource):
+    """ """
+
+    @scrape.expect(season_parser)
+    @scrape.response(200, "OK")
+    @scrape.response(400, "Bad Request")
+    def get(self) -> Response:
+        args = season_parser.parse_args()
+
+        year = args["year"]
+
+        if year not in VALID_YEARS:
+            return Response(
+                orjson.dumps("Invalid year selection."),
+                mimetype="application/json",
+                status=400,
+            )
+
+        def generate() -> bytes:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                months = executor.map(
+                    lambda month: build_month_fixtures(month, year), SEASON_MONTHS
+                )
+
+                yield (
+                    f'{{"year":{year},"monthCount":{len(SEASON_MONTHS)},"months":['
+                ).encode()
+
+                for index, month_object in enumerate(months):
+                    if index:
+                        yield b","
+                    yield orjson.dumps(month_object)
+
+                yield b"]}"
+
+        return Response(generate(), mimetype="application/json", status=200)
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     app.run(host="0.0.0.0", port=port)
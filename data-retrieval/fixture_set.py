@@ -1,6 +1,25 @@
-from selenium_scraper import SeleniumScraper
+import re
+
+from html_scraper import HtmlScraper
 import pandas as pd
 
+FIXTURE_PATTERN = re.compile(
+    r"^\S+\s+"
+    r"(?P<date>\S+\s+\S+\s+\S+)\s+"
+    r"(?P<tip_off_time>\S+)\s+"
+    r"(?P<away_team>(?:Los|Golden|New|Oklahoma|Portland|San)\s+\S+\s+\S+|\S+\s+\S+)\s+"
+    r"(?P<away_points>\d+)\s+"
+    r"(?P<home_team>(?:Los|Golden|New|Oklahoma|Portland|San)\s+\S+\s+\S+|\S+\s+\S+)\s+"
+    r"(?P<home_points>\d+)"
+    r"(?:\s+Box\s+Score)?"
+    r"(?:\s+\d?OT)*"
+    r"(?:\s+\(IV\))?"
+    r"(?:\s+Play-In\s+Game)?"
+    r"(?:\s+(?P<attendance>[\d,]+))?"
+)
+
+UNNECESSARY_HEADINGS = frozenset({"(ET)", "Notes", "Arena"})
+
 
 class FixtureSet:
     """
@@ -12,6 +31,8 @@ class FixtureSet:
     :type year: str
     """
 
+    __slots__ = ("__month", "__year", "__fixtures", "__headings")
+
     def __init__(self, month: str, year: str):
         self.__month = month
         self.__year = year
@@ -20,8 +41,6 @@ class FixtureSet:
 
         self.__headings = self.__create_headings()
 
-        self.__dataframe = pd.DataFrame(columns=self.__headings)
-
     def get_dataframe(self) -> pd.DataFrame:
         """
         Retrieve a dataframe populated with the fixtures for the given timespan.
@@ -30,9 +49,17 @@ class FixtureSet:
         :rtype: DataFrame
         """
 
-        self.__populate_dataframe()
+        return pd.DataFrame(self.get_fixtures(), columns=self.__headings)
+
+    def get_fixtures(self) -> list[dict[str, str | int]]:
+        """
+        Retrieve a list of fixture dictionaries for the given timespan.
+
+        :return: List of fixture dictionaries.
+        :rtype: list[dict[str, str | int]]
+        """
 
-        return self.__dataframe
+        return self.__create_rows()
 
     def __generate_fixtures(self) -> list[str]:
         """
@@ -42,13 +69,11 @@ class FixtureSet:
         :rtype: list[str]
         """
 
-        this_scraper = SeleniumScraper()
-        fixtures = this_scraper.scrape_fixtures(
+        this_scraper = HtmlScraper()
+
+        return this_scraper.scrape_fixtures(
             f"https://www.basketball-reference.com/leagues/NBA_{self.__year}_games-{self.__month}.html"
         )
-        this_scraper.driver.quit()
-
-        return fixtures
 
     def __create_headings(self) -> list[str]:
         """
@@ -75,9 +100,7 @@ class FixtureSet:
         """
 
         return [
-            heading
-            for heading in headings
-            if heading != "(ET)" and heading != "Notes" and heading != "Arena"
+            heading for heading in headings if heading not in UNNECESSARY_HEADINGS
         ]
 
     @staticmethod
@@ -111,159 +134,46 @@ class FixtureSet:
 
         return headings
 
-    def __create_row(self, fixture: str) -> dict[str, str]:
+    @staticmethod
+    def __create_row(fixture: str) -> dict[str, str | int] | None:
         """
         Convert a line of fixture data to a fixture dictionary which can then be appended as a row to a dataframe.
 
         :param fixture: Line of fixture data.
         :type fixture: str
-        :return: Fixture dictionary.
-        :rtype: dict[str, str]
+        :return: Fixture dictionary, or None if the fixture has not been played.
+        :rtype: dict[str, str | int] | None
         """
 
-        split_row = fixture.split()
-
-        split_row = [
-            value
-            for value in split_row
-            if value != "OT"
-            and value != "2OT"
-            and value != "3OT"
-            and value != "4OT"
-            and value != "(IV)"
-            and value != "Box"
-            and value != "Score"
-            and value != "Play-In"
-            and value != "Game"
-        ]
+        match = FIXTURE_PATTERN.match(fixture)
 
-        return self.__format_fixtures(split_row)
+        if match is None:
+            return None
 
-    @staticmethod
-    def __format_fixtures(fixture_items: list[str]) -> dict[str, str]:
-        three_names = ["Los", "Golden", "New", "Oklahoma", "Portland", "San"]
-        last_words = [
-            "Clippers",
-            "Lakers",
-            "Warriors",
-            "Pelicans",
-            "Knicks",
-            "Thunder",
-            "Blazers",
-            "Spurs",
-        ]
-
-        if len(fixture_items) < 14:
-            return {"game": "not played"}
-
-        fixture_dictionary = {
-            "Date": f"{fixture_items[1]} {fixture_items[2]} {fixture_items[3]}",
-            "Tip-Off Time": f"{fixture_items[4]}",
-            "Away Team": f"{fixture_items[5]} {fixture_items[6]}",
-            "Away PTS": f"{fixture_items[7]}",
-            "Home Team": f"{fixture_items[8]} {fixture_items[9]}",
-            "Home PTS": f"{fixture_items[10]}",
-            "Attendance": f"{fixture_items[11]}",
+        return {
+            "Date": match["date"],
+            "Tip-Off Time": match["tip_off_time"],
+            "Away Team": match["away_team"],
+            "Away PTS": int(match["away_points"]),
+            "Home Team": match["home_team"],
+            "Home PTS": int(match["home_points"]),
+            "Attendance": match["attendance"] or "0",
         }
 
-        if len(fixture_items) == 14 and fixture_items[7] in last_words:
-            fixture_dictionary[
-                "Away Team"
-            ] = f"{fixture_items[5]} {fixture_items[6]} {fixture_items[7]}"
-            fixture_dictionary["Away PTS"] = f"{fixture_items[8]}"
-            fixture_dictionary["Home Team"] = f"{fixture_items[9]} {fixture_items[10]}"
-            fixture_dictionary["Home PTS"] = f"{fixture_items[11]}"
-            fixture_dictionary["Attendance"] = "0"
-
-        if (
-            len(fixture_items) == 14
-            and fixture_items[7] in last_words
-            and fixture_items[11] in last_words
-        ):
-            fixture_dictionary[
-                "Away Team"
-            ] = f"{fixture_items[5]} {fixture_items[6]} {fixture_items[7]}"
-            fixture_dictionary["Away PTS"] = f"{fixture_items[8]}"
-            fixture_dictionary[
-                "Home Team"
-            ] = f"{fixture_items[9]} {fixture_items[10]} {fixture_items[11]}"
-            fixture_dictionary["Home PTS"] = f"{fixture_items[12]}"
-            fixture_dictionary["Attendance"] = f"{fixture_items[13]}"
-
-        if len(fixture_items) == 17:
-            fixture_dictionary[
-                "Away Team"
-            ] = f"{fixture_items[5]} {fixture_items[6]} {fixture_items[7]}"
-            fixture_dictionary["Away PTS"] = f"{fixture_items[8]}"
-            fixture_dictionary[
-                "Home Team"
-            ] = f"{fixture_items[9]} {fixture_items[10]} {fixture_items[11]}"
-            fixture_dictionary["Home PTS"] = f"{fixture_items[12]}"
-            fixture_dictionary["Attendance"] = f"{fixture_items[13]}"
-
-        elif len(fixture_items) == 16 and fixture_items[5] in three_names:
-            fixture_dictionary[
-                "Away Team"
-            ] = f"{fixture_items[5]} {fixture_items[6]} {fixture_items[7]}"
-            fixture_dictionary["Away PTS"] = f"{fixture_items[8]}"
-            if fixture_items[9] in three_names:
-                fixture_dictionary[
-                    "Home Team"
-                ] = f"{fixture_items[9]} {fixture_items[10]} {fixture_items[11]}"
-                fixture_dictionary["Home PTS"] = f"{fixture_items[12]}"
-                fixture_dictionary["Attendance"] = f"{fixture_items[13]}"
-            else:
-                fixture_dictionary[
-                    "Home Team"
-                ] = f"{fixture_items[9]} {fixture_items[10]}"
-                fixture_dictionary["Home PTS"] = f"{fixture_items[11]}"
-                fixture_dictionary["Attendance"] = f"{fixture_items[12]}"
-
-        elif len(fixture_items) == 16 and fixture_items[5] not in three_names:
-            fixture_dictionary["Away Team"] = f"{fixture_items[5]} {fixture_items[6]}"
-            fixture_dictionary["Away PTS"] = f"{fixture_items[7]}"
-            fixture_dictionary[
-                "Home Team"
-            ] = f"{fixture_items[8]} {fixture_items[9]} {fixture_items[10]}"
-            fixture_dictionary["Home PTS"] = f"{fixture_items[11]}"
-            fixture_dictionary["Attendance"] = f"{fixture_items[12]}"
-
-        elif len(fixture_items) == 15 and fixture_items[5] in three_names:
-            fixture_dictionary[
-                "Away Team"
-            ] = f"{fixture_items[5]} {fixture_items[6]} {fixture_items[7]}"
-            fixture_dictionary["Away PTS"] = f"{fixture_items[8]}"
-            fixture_dictionary["Home Team"] = f"{fixture_items[9]} {fixture_items[10]}"
-            fixture_dictionary["Home PTS"] = f"{fixture_items[11]}"
-            fixture_dictionary["Attendance"] = f"{fixture_items[12]}"
-
-        elif len(fixture_items) == 15 and fixture_items[5] not in three_names:
-            fixture_dictionary["Away Team"] = f"{fixture_items[5]} {fixture_items[6]}"
-            fixture_dictionary["Away PTS"] = f"{fixture_items[7]}"
-            if fixture_items[8] in three_names:
-                fixture_dictionary[
-                    "Home Team"
-                ] = f"{fixture_items[8]} {fixture_items[9]} {fixture_items[10]}"
-                fixture_dictionary["Home PTS"] = f"{fixture_items[11]}"
-                fixture_dictionary["Attendance"] = f"{fixture_items[12]}"
-            else:
-                fixture_dictionary[
-                    "Home Team"
-                ] = f"{fixture_items[8]} {fixture_items[9]}"
-                fixture_dictionary["Home PTS"] = f"{fixture_items[10]}"
-                fixture_dictionary["Attendance"] = f"{fixture_items[11]}"
-
-        return fixture_dictionary
-
-    def __populate_dataframe(self) -> None:
+    def __create_rows(self) -> list[dict[str, str | int]]:
         """
-        Populate the fixtures dataframe with the rows of fixtures.
+        Convert the lines of fixture data to a list of fixture dictionaries.
+
+        :return: List of fixture dictionaries.
+        :rtype: list[dict[str, str | int]]
         """
 
-        data = self.__fixtures
-        data.pop(0)
+        rows = []
+
+        for line in self.__fixtures[1:]:
+            if not line.startswith("Date"):
+                row = self.__create_row(line)
+                if row is not None:
+                    rows.append(row)
 
-        for row in data:
-            if row[0:4] != "Date":
-                if self.__create_row(row) != {"game": "not played"}:
-                    self.__dataframe.loc[len(self.__dataframe)] = self.__create_row(row)
+        return rows
@@ -0,0 +1,169 @@
+import asyncio
+
+import httpx
+import requests
+from lxml import html
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36"
+)
+
+
+def fetch_pages(urls: list[str]) -> list[str]:
+    """
+    Fetch many pages of HTML concurrently.
+
+    The requests are issued together over a bounded connection pool, so the
+    total wall time approaches that of the slowest single page rather than
+    the sum of all of them.
+
+    :param urls: The URLs of the pages to fetch.
+    :type urls: list[str]
+    :return: The HTML of each page, in the order the URLs were given.
+    :rtype: list[str]
+    """
+
+    return asyncio.run(__fetch_pages(urls))
+
+
+async def __fetch_pages(urls: list[str]) -> list[str]:
+    """
+    Fetch many pages of HTML concurrently within the running event loop.
+
+    :param urls: The URLs of the pages to fetch.
+    :type urls: list[str]
+    :return: The HTML of each page, in the order the URLs were given.
+    :rtype: list[str]
+    """
+
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=20),
+        headers={"User-Agent": USER_AGENT},
+        timeout=10,
+    ) as client:
+        responses = await asyncio.gather(*[client.get(url) for url in urls])
+
+    for response in responses:
+        response.raise_for_status()
+
+    return [response.text for response in responses]
+
+
+def extract_table_lines(page_html: str, table_id: str) -> list[str]:
+    """
+    Extract the lines of a table from a page of HTML.
+
+    Each line contains the text of one table row, with the text of its cells
+    separated by single spaces. Basketball-Reference serves some tables inside
+    HTML comments for deferred rendering, so comments are searched when the
+    table is not found in the document itself.
+
+    :param page_html: The HTML of the page upon which the table is displayed.
+    :type page_html: str
+    :param table_id: The id of the table element.
+    :type table_id: str
+    :return: Lines of the table.
+    :rtype: list[str]
+    """
+
+    tree = html.fromstring(page_html)
+    tables = tree.xpath(f'//table[@id="{table_id}"]')
+
+    if not tables:
+        tables = __find_commented_tables(tree, table_id)
+
+    if not tables:
+        raise LookupError(f"No table with id '{table_id}' was found.")
+
+    lines = []
+
+    for row in tables[0].xpath(".//tr"):
+        cells = [
+            " ".join(cell.text_content().split()) for cell in row.xpath("./th|./td")
+        ]
+        lines.append(" ".join(cell for cell in cells if cell))
+
+    return lines
+
+
+def __find_commented_tables(tree, table_id: str) -> list:
+    """
+    Find a table served inside an HTML comment.
+
+    :param tree: The parsed document tree.
+    :param table_id: The id of the table element.
+    :type table_id: str
+    :return: Matching table elements.
+    :rtype: list
+    """
+
+    for comment in tree.xpath("//comment()"):
+        if f'id="{table_id}"' in comment.text:
+            return html.fromstring(comment.text).xpath(f'//table[@id="{table_id}"]')
+
+    return []
+
+
+class HtmlScraper:
+    """
+    HTML Scraper object for scraping web pages for data without launching a browser.
+    """
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+
+    def __get_fixtures_lines(self, url: str) -> list[str]:
+        """
+        Scrape the lines of a fixtures table from Basketball-Reference.
+
+        :param url: The URL of the page upon which the table is displayed.
+        :type url: str
+        :return: Lines of fixtures table.
+        :rtype: list[str]
+        """
+
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+
+        return extract_table_lines(response.text, "schedule")
+
+    def scrape_fixtures(self, url: str) -> list[str]:
+        """
+        Scrape the lines of a fixtures table from Basketball-Reference.
+
+        :param url: The URL of the page upon which the table is displayed.
+        :type url: str
+        :return: Lines of fixtures table.
+        :rtype: list[str]
+        """
+
+        return self.__get_fixtures_lines(url)
+
+    def __get_statistics_lines(self, url: str) -> list[str]:
+        """
+        Scrape the lines of a statistics table from Basketball-Reference.
+
+        :param url: The URL of the page upon which the table is displayed.
+        :type url: str
+        :return: Lines of statistics table.
+        :rtype: list[str]
+        """
+
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+
+        return extract_table_lines(response.text, "team_and_opponent")
+
+    def scrape_statistics(self, url: str) -> list[str]:
+        """
+        Scrape the lines of a statistics table from Basketball-Reference.
+
+        :param url: The URL of the page upon which the table is displayed.
+        :type url: str
+        :return: Lines of statistics table.
+        :rtype: list[str]
+        """
+
+        return self.__get_statistics_lines(url)
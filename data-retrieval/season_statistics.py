@@ -1,5 +1,36 @@
-from selenium_scraper import SeleniumScraper
-import pandas as pd
+from __future__ import annotations
+
+from pathlib import Path
+
+from html_scraper import HtmlScraper, extract_table_lines, fetch_pages
+
+CACHE_DIRECTORY = Path("~/.cache/season_statistics").expanduser()
+
+STATISTIC_COLUMNS = (
+    "G",
+    "MP",
+    "FG",
+    "FGA",
+    "FG%",
+    "3P",
+    "3PA",
+    "3P%",
+    "2P",
+    "2PA",
+    "2P%",
+    "FT",
+    "FTA",
+    "FT%",
+    "ORB",
+    "DRB",
+    "TRB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+    "PF",
+    "PTS",
+)
 
 
 class SeasonStatistics:
@@ -10,21 +41,120 @@ class SeasonStatistics:
     :type team_abbreviation: str
     :param year: The team's season for which the advanced statistics pertain.
     :type year: str
+    :param refresh: Whether to re-scrape the statistics even when a cached
+        copy exists, defaults to False.
+    :type refresh: bool
     """
 
-    def __init__(self, team_abbreviation: str, year: str):
+    __slots__ = (
+        "__team_abbreviation",
+        "__year",
+        "__refresh",
+        "__statistics",
+        "__team_statistics",
+        "__opponent_statistics",
+    )
+
+    def __init__(self, team_abbreviation: str, year: str, refresh: bool = False):
         self.__team_abbreviation = team_abbreviation
         self.__year = year
+        self.__refresh = refresh
+
+        self.__statistics = None
+        self.__team_statistics = None
+        self.__opponent_statistics = None
+
+    @classmethod
+    def bulk(
+        cls, team_year_pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], pd.DataFrame]:
+        """
+        Retrieve team statistics dataframes for many (team, year) pairs.
+
+        The pages are fetched concurrently over HTTP, so a bulk run costs
+        roughly one page's round-trip rather than one per pair.
+
+        :param team_year_pairs: Pairs of team abbreviation and year.
+        :type team_year_pairs: list[tuple[str, str]]
+        :return: A team statistics dataframe per (team, year) pair.
+        :rtype: dict[tuple[str, str], DataFrame]
+        """
+
+        pages = fetch_pages(
+            [
+                f"https://www.basketball-reference.com/teams/{team}/{year}.html"
+                for team, year in team_year_pairs
+            ]
+        )
+
+        return {
+            pair: cls.__from_statistics(
+                pair[0], pair[1], extract_table_lines(page, "team_and_opponent")
+            ).get_team_dataframe()
+            for pair, page in zip(team_year_pairs, pages)
+        }
 
-        self.__statistics = self.__generate_statistics()
+    @classmethod
+    def collect(cls, team_year_pairs: list[tuple[str, str]]) -> pd.DataFrame:
+        """
+        Retrieve a single dataframe of team statistics rows for many
+        (team, year) pairs.
 
-        self.__headings = self.__create_headings()
+        The rows are gathered as plain dictionaries and the dataframe is
+        constructed once at the end, which is far cheaper than concatenating
+        the single-row dataframes returned by get_team_dataframe. Prefer this
+        over looping get_team_dataframe when combining teams or seasons.
 
-        self.__team_statistics = self.__create_team_statistics()
-        self.__opponent_statistics = self.__create_opponent_statistics()
+        :param team_year_pairs: Pairs of team abbreviation and year.
+        :type team_year_pairs: list[tuple[str, str]]
+        :return: Dataframe with one team statistics row per pair.
+        :rtype: DataFrame
+        """
 
-        self.__team_statistics_dataframe = pd.DataFrame(columns=self.__headings)
-        self.__opponent_statistics_dataframe = pd.DataFrame(columns=self.__headings)
+        import pandas as pd
+
+        pages = fetch_pages(
+            [
+                f"https://www.basketball-reference.com/teams/{team}/{year}.html"
+                for team, year in team_year_pairs
+            ]
+        )
+
+        rows = []
+
+        for (team, year), page in zip(team_year_pairs, pages):
+            this_season_statistics = cls.__from_statistics(
+                team, year, extract_table_lines(page, "team_and_opponent")
+            )
+            rows.append(
+                cls.__to_dataframe_row(
+                    this_season_statistics.__get_team_statistics()
+                )
+            )
+
+        return pd.DataFrame.from_records(rows, columns=STATISTIC_COLUMNS)
+
+    @classmethod
+    def __from_statistics(
+        cls, team_abbreviation: str, year: str, statistics: list[str]
+    ) -> "SeasonStatistics":
+        """
+        Create a Season Statistics object from already-scraped table lines.
+
+        :param team_abbreviation: The team's three-letter abbreviation.
+        :type team_abbreviation: str
+        :param year: The team's season for which the advanced statistics pertain.
+        :type year: str
+        :param statistics: Lines of a statistics table.
+        :type statistics: list[str]
+        :return: The Season Statistics object.
+        :rtype: SeasonStatistics
+        """
+
+        this_season_statistics = cls(team_abbreviation, year)
+        this_season_statistics.__statistics = statistics
+
+        return this_season_statistics
 
     def get_team_dataframe(self) -> pd.DataFrame:
         """
@@ -34,9 +164,12 @@ class SeasonStatistics:
         :rtype: DataFrame
         """
 
-        self.__populate_team_dataframe()
+        import pandas as pd
 
-        return self.__team_statistics_dataframe
+        return pd.DataFrame(
+            [self.__to_dataframe_row(self.__get_team_statistics())],
+            columns=STATISTIC_COLUMNS,
+        )
 
     def get_opponent_dataframe(self) -> pd.DataFrame:
         """
@@ -46,139 +179,120 @@ class SeasonStatistics:
         :rtype: DataFrame
         """
 
-        self.__populate_opponent_dataframe()
+        import pandas as pd
 
-        return self.__opponent_statistics_dataframe
+        return pd.DataFrame(
+            [self.__to_dataframe_row(self.__get_opponent_statistics())],
+            columns=STATISTIC_COLUMNS,
+        )
 
-    def __generate_statistics(self) -> list[str]:
+    def __get_statistics(self) -> list[str]:
         """
-        Generate statistics by scraping a Basketball-Reference table.
+        Retrieve the lines of the statistics table, scraping them on first use.
 
         :return: Lines of a statistics table.
         :rtype: list[str]
         """
 
-        this_scraper = SeleniumScraper()
-        statistics = this_scraper.scrape_statistics(
-            f"https://www.basketball-reference.com/teams/"
-            f"{self.__team_abbreviation}/{self.__year}.html#all_team_and_opponent"
-        )
-        this_scraper.driver.quit()
+        if self.__statistics is None:
+            self.__statistics = self.__generate_statistics()
 
-        return statistics
+        return self.__statistics
 
-    def __create_headings(self) -> list[str]:
+    def __get_team_statistics(self) -> list[float | int]:
         """
-        Create a list of headings from the lines of a statistics table.
+        Retrieve the team's row of statistics values, parsing it on first use.
 
-        :return: List of headings.
-        :rtype: list[str]
+        :return: Row of statistics values.
+        :rtype: list[float | int]
         """
 
-        heading_row = self.__statistics[0]
-        headings = heading_row.split()
+        if self.__team_statistics is None:
+            self.__team_statistics, self.__opponent_statistics = self.__parse_rows()
 
-        return headings
+        return self.__team_statistics
 
-    def __create_team_statistics(self) -> list[str]:
+    def __get_opponent_statistics(self) -> list[float | int]:
         """
-        Create a row of statistics values from the lines of a statistics table.
+        Retrieve the opponents' row of statistics values, parsing it on first use.
 
-        :return: Row of statistics values.
-        :rtype: list[str]
+        :return: Row of opponents' statistics values.
+        :rtype: list[float | int]
         """
 
-        team_statistics_row = self.__statistics[1]
-        team_statistics = team_statistics_row.split()
-        team_statistics.pop(0)
+        if self.__opponent_statistics is None:
+            self.__team_statistics, self.__opponent_statistics = self.__parse_rows()
 
-        return self.__format_decimals(team_statistics)
+        return self.__opponent_statistics
 
-    def __create_opponent_statistics(self) -> list[str]:
+    def __generate_statistics(self) -> list[str]:
         """
-        Create a row of the opponents' statistics values from the lines of a statistics table.
+        Generate statistics by scraping a Basketball-Reference table.
 
-        :return: Row of opponents' statistics values.
+        Scraped lines are cached on disk per (team, year) so repeat
+        constructions skip the network round-trip entirely; past seasons
+        never change, so the cache only needs invalidating via refresh. The
+        page is fetched over plain HTTP, with Selenium kept as a fallback for
+        the case where the table cannot be found in the static HTML.
+
+        :return: Lines of a statistics table.
         :rtype: list[str]
         """
 
-        opponent_statistics_row = self.__statistics[5]
-        opponent_statistics = opponent_statistics_row.split()
-        opponent_statistics.pop(0)
+        cache_path = (
+            CACHE_DIRECTORY / f"{self.__team_abbreviation}_{self.__year}.txt"
+        )
 
-        return self.__format_decimals(opponent_statistics)
+        if not self.__refresh and cache_path.exists():
+            return cache_path.read_text().splitlines()
 
-    @staticmethod
-    def __format_decimals(statistics: list[str]) -> list[str]:
-        """
-        Format the decimal values in a row of statistics values.
+        url = (
+            f"https://www.basketball-reference.com/teams/"
+            f"{self.__team_abbreviation}/{self.__year}.html#all_team_and_opponent"
+        )
 
-        :param statistics: Row of statistics values.
-        :type statistics: list[str]
-        :return: Row of statistics values with formatted decimal values.
-        :rtype: list[str]
-        """
+        try:
+            statistics = HtmlScraper().scrape_statistics(url)
+        except LookupError:
+            from selenium_scraper import SeleniumScraper
 
-        formatted_statistics = []
+            statistics = SeleniumScraper.shared().scrape_statistics(url)
 
-        for statistic in statistics:
-            if statistic[0] == ".":
-                statistic = "0" + statistic
-            formatted_statistics.append(statistic)
+        CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text("\n".join(statistics))
 
-        return formatted_statistics
+        return statistics
 
-    def __populate_team_dataframe(self) -> None:
+    def __parse_rows(self) -> tuple[list[float | int], list[float | int]]:
         """
-        Populate the team dataframe with the statistics row.
+        Parse the team's and their opponents' rows of statistics values from
+        the lines of a statistics table in a single pass.
+
+        :return: Rows of team and opponent statistics values.
+        :rtype: tuple[list[float | int], list[float | int]]
         """
 
-        self.__team_statistics_dataframe.loc[
-            len(self.__team_statistics_dataframe)
-        ] = self.__to_dataframe_row(self.__team_statistics)
+        statistics = self.__get_statistics()
 
-    def __populate_opponent_dataframe(self) -> None:
-        """
-        Populate the opponent dataframe with the statistics row.
-        """
+        team_row, opponent_row = (
+            [
+                float(value) if "." in value else int(value)
+                for value in statistics[index].split()[1:]
+            ]
+            for index in (1, 5)
+        )
 
-        self.__opponent_statistics_dataframe.loc[
-            len(self.__opponent_statistics_dataframe)
-        ] = self.__to_dataframe_row(self.__opponent_statistics)
+        return team_row, opponent_row
 
     @staticmethod
-    def __to_dataframe_row(statistics: list[str]) -> dict[str, str]:
+    def __to_dataframe_row(statistics: list[float | int]) -> dict[str, float | int]:
         """
         Convert a list of statistics to a statistics dictionary which can then be appended as a row to a dataframe.
 
         :param statistics: List of statistics.
-        :type statistics: list[str]
+        :type statistics: list[float | int]
         :return: Statistics dictionary.
-        :rtype: dict[str, str]
+        :rtype: dict[str, float | int]
         """
 
-        return {
-            "G": statistics[0],
-            "MP": statistics[1],
-            "FG": statistics[2],
-            "FGA": statistics[3],
-            "FG%": statistics[4],
-            "3P": statistics[5],
-            "3PA": statistics[6],
-            "3P%": statistics[7],
-            "2P": statistics[8],
-            "2PA": statistics[9],
-            "2P%": statistics[10],
-            "FT": statistics[11],
-            "FTA": statistics[12],
-            "FT%": statistics[13],
-            "ORB": statistics[14],
-            "DRB": statistics[15],
-            "TRB": statistics[16],
-            "AST": statistics[17],
-            "STL": statistics[18],
-            "BLK": statistics[19],
-            "TOV": statistics[20],
-            "PF": statistics[21],
-            "PTS": statistics[22],
-        }
+        return dict(zip(STATISTIC_COLUMNS, statistics))
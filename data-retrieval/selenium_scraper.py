@@ -1,6 +1,9 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
+import atexit
+from pathlib import Path
+
+from html_scraper import extract_table_lines
+
+PROFILE_DIRECTORY = Path("~/.cache/scraper-chrome-profile").expanduser()
 
 
 class SeleniumScraper:
@@ -8,30 +11,95 @@ class SeleniumScraper:
     Selenium Scraper object for scraping web pages for data.
     """
 
+    __slots__ = ("options", "driver")
+
+    __shared_scraper = None
+
+    @classmethod
+    def shared(cls) -> "SeleniumScraper":
+        """
+        Retrieve a shared Selenium Scraper, launching the browser on first use.
+
+        Launching chromedriver takes seconds, so callers should prefer this
+        shared instance over constructing and quitting their own. The shared
+        browser is quit automatically when the interpreter exits.
+
+        :return: The shared Selenium Scraper.
+        :rtype: SeleniumScraper
+        """
+
+        if cls.__shared_scraper is None:
+            cls.__shared_scraper = cls()
+            atexit.register(cls.__shared_scraper.driver.quit)
+
+        return cls.__shared_scraper
+
     def __init__(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
         self.options = Options()
-        self.options.headless = True
+        self.options.add_argument("--headless=new")
+        self.options.add_argument("--disable-gpu")
         self.options.add_argument("--window-size=1920,1200")
+        self.options.add_argument("--blink-settings=imagesEnabled=false")
+        self.options.add_experimental_option(
+            "prefs",
+            {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+            },
+        )
+        self.options.add_argument(f"--user-data-dir={PROFILE_DIRECTORY}")
+        self.options.add_argument(
+            f"--disk-cache-dir={PROFILE_DIRECTORY / 'disk-cache'}"
+        )
+        self.options.page_load_strategy = "eager"
 
         self.driver = webdriver.Chrome(
             options=self.options, executable_path="../chromedriver.exe"
         )
 
-    def __get_fixtures_lines(self, url: str) -> list[str]:
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {"urls": ["*.css", "*.png", "*.jpg", "*.gif", "*.woff*"]},
+        )
+
+    def __enter__(self) -> "SeleniumScraper":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.driver.quit()
+
+    def __get_table_lines(self, url: str, table_id: str) -> list[str]:
         """
-        Scrape the lines of a fixtures table from Basketball-Reference.
+        Scrape the lines of a table from Basketball-Reference.
+
+        The rendered document is pulled down in a single DevTools Protocol
+        round-trip and handed to the shared lxml table extraction, avoiding
+        the per-element find_element call and the full innerText layout
+        computation that WebElement.text triggers.
 
         :param url: The URL of the page upon which the table is displayed.
         :type url: str
-        :return: Lines of fixtures table.
+        :param table_id: The id of the table element.
+        :type table_id: str
+        :return: Lines of the table.
         :rtype: list[str]
         """
 
         self.driver.get(url)
-        table_web_element = self.driver.find_element(By.ID, "schedule")
-        table_text = table_web_element.text
+        page_html = self.driver.execute_cdp_cmd(
+            "Runtime.evaluate",
+            {
+                "expression": "document.documentElement.outerHTML",
+                "returnByValue": True,
+            },
+        )["result"]["value"]
 
-        return table_text.split("\n")
+        return extract_table_lines(page_html, table_id)
 
     def scrape_fixtures(self, url: str) -> list[str]:
         """
@@ -43,23 +111,7 @@ class SeleniumScraper:
         :rtype: list[str]
         """
 
-        return self.__get_fixtures_lines(url)
-
-    def __get_statistics_lines(self, url: str) -> list[str]:
-        """
-        Scrape the lines of a statistics table from Basketball-Reference.
-
-        :param url: The URL of the page upon which the table is displayed.
-        :type url: str
-        :return: Lines of statistics table.
-        :rtype: list[str]
-        """
-
-        self.driver.get(url)
-        table_web_element = self.driver.find_element(By.ID, "team_and_opponent")
-        table_text = table_web_element.text
-
-        return table_text.split("\n")
+        return self.__get_table_lines(url, "schedule")
 
     def scrape_statistics(self, url: str) -> list[str]:
         """
@@ -71,4 +123,4 @@ class SeleniumScraper:
         :rtype: list[str]
         """
 
-        return self.__get_statistics_lines(url)
+        return self.__get_table_lines(url, "team_and_opponent")